@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from collections import Counter
+from itertools import repeat
 from pathlib import Path
 import re
 
+import numpy as np
 import pandas as pd
 
 
-LINE_PATTERN = re.compile(r"^(?P<timestamp>[^|]+)\|(?P<speaker>[^|]+)\|(?P<text>.+)$")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 WORD_PATTERN = re.compile(r"[A-Za-z']+")
 
 POSITIVE_WORDS = {
@@ -30,6 +32,22 @@ NEGATIVE_WORDS = {
     "blockers",
     "disagree",
 }
+SENTIMENT_SCORES = {
+    **{word: 1 for word in POSITIVE_WORDS},
+    **{word: -1 for word in NEGATIVE_WORDS},
+}
+SENTIMENT_LABELS = ["positive", "neutral", "negative"]
+
+
+# Byte-level twin of WORD_PATTERN. 0xFF never occurs in UTF-8, so it can mark
+# message boundaries in the scan buffer without colliding with message text.
+MESSAGE_BREAK = b"\xff"
+TOKEN_SCAN_PATTERN = re.compile(rb"[A-Za-z']+|\xff")
+MESSAGE_BREAK_CODE = 2
+TOKEN_CODES = {
+    **{word.encode(): score for word, score in SENTIMENT_SCORES.items()},
+    MESSAGE_BREAK: MESSAGE_BREAK_CODE,
+}
 
 
 class TranscriptParseError(Exception):
@@ -42,22 +60,36 @@ def parse_transcript(path: Path) -> pd.DataFrame:
     if not path.is_file():
         raise FileNotFoundError(f"Transcript path is not a file: {path}")
 
-    records: list[dict[str, str]] = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = line.strip()
-        if not line:
-            continue
-        match = LINE_PATTERN.match(line)
-        if not match:
-            raise TranscriptParseError(f"Malformed line at {line_number}: {line}")
-        record = {k: v.strip() for k, v in match.groupdict().items()}
-        records.append(record)
-
-    if not records:
+    timestamps: list[str] = []
+    speakers: list[str] = []
+    texts: list[str] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split("|", 2)
+            if len(parts) != 3 or not all(parts):
+                raise TranscriptParseError(f"Malformed line at {line_number}: {line}")
+            timestamps.append(parts[0].strip())
+            speakers.append(parts[1].strip())
+            texts.append(parts[2].strip())
+
+    if not texts:
         raise TranscriptParseError("No valid transcript lines found.")
 
-    df = pd.DataFrame.from_records(records)
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    df = pd.DataFrame({"timestamp": timestamps, "speaker": speakers, "text": texts})
+    df["speaker"] = df["speaker"].astype("category")
+    parsed = pd.to_datetime(df["timestamp"], format=TIMESTAMP_FORMAT, errors="coerce")
+    unparsed = parsed.isna()
+    try:
+        if unparsed.all():
+            parsed = pd.to_datetime(df["timestamp"], errors="coerce")
+        elif unparsed.any():
+            parsed[unparsed] = pd.to_datetime(df.loc[unparsed, "timestamp"], errors="coerce")
+    except (TypeError, ValueError) as exc:
+        raise TranscriptParseError("Unable to parse one or more timestamps.") from exc
+    df["timestamp"] = parsed
     if df["timestamp"].isna().any():
         raise TranscriptParseError("Unable to parse one or more timestamps.")
     return df
@@ -68,10 +100,10 @@ def count_words(text: str) -> int:
 
 
 def sentiment_label(text: str) -> str:
-    words = [word.lower() for word in WORD_PATTERN.findall(text)]
-    score = sum(word in POSITIVE_WORDS for word in words) - sum(
-        word in NEGATIVE_WORDS for word in words
-    )
+    score = 0
+    scores = SENTIMENT_SCORES
+    for match in WORD_PATTERN.finditer(text):
+        score += scores.get(match.group().lower(), 0)
     if score > 0:
         return "positive"
     if score < 0:
@@ -79,33 +111,75 @@ def sentiment_label(text: str) -> str:
     return "neutral"
 
 
-def build_report(df: pd.DataFrame) -> str:
-    df = df.copy()
-    df["word_count"] = df["text"].apply(count_words)
-    df["sentiment"] = df["text"].apply(sentiment_label)
-    df["interruption"] = df["text"].str.contains("interrupt", case=False, regex=False)
+def token_counts(text: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n = len(text)
+    buffer = MESSAGE_BREAK.join(t.encode("utf-8") for t in text.tolist()).lower()
+    tokens = TOKEN_SCAN_PATTERN.findall(buffer)
+    codes = np.fromiter(map(TOKEN_CODES.get, tokens, repeat(0)), dtype=np.int8, count=len(tokens))
+    separators = codes == MESSAGE_BREAK_CODE
+    rows = np.cumsum(separators)
+    word_count = np.bincount(rows[~separators], minlength=n).astype(np.int32)
+    pos_count = np.bincount(rows[codes == 1], minlength=n).astype(np.int32)
+    neg_count = np.bincount(rows[codes == -1], minlength=n).astype(np.int32)
+    return word_count, pos_count, neg_count
+
+
+def sentiment_labels(score: np.ndarray) -> pd.Categorical:
+    labels = np.select([score > 0, score < 0], ["positive", "negative"], default="neutral")
+    return pd.Categorical(labels, categories=SENTIMENT_LABELS)
+
+
+def _prepare(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
+    word_count, pos_count, neg_count = token_counts(df["text"])
+    derived = pd.DataFrame(
+        {
+            "speaker": df["speaker"].array,
+            "word_count": word_count,
+            "sentiment": sentiment_labels(pos_count - neg_count),
+            "interruption": df["text"]
+            .str.contains("interrupt", case=False, regex=False, na=False)
+            .to_numpy(dtype=bool, copy=False),
+        }
+    )
 
+    agg = derived.groupby("speaker", sort=False, observed=True).agg(
+        msgs=("word_count", "size"),
+        words=("word_count", "sum"),
+        avg_len=("word_count", "mean"),
+        interrupts=("interruption", "sum"),
+    )
+    sentiment_counts = derived["sentiment"].value_counts(sort=False)
+    return derived, agg, sentiment_counts
+
+
+def build_report(df: pd.DataFrame, agg: pd.DataFrame, sentiment_counts: pd.Series) -> str:
     total_messages = len(df)
     total_words = int(df["word_count"].sum())
     avg_message_length = df["word_count"].mean()
 
-    messages_per_speaker = df["speaker"].value_counts()
-    avg_length_per_speaker = df.groupby("speaker")["word_count"].mean()
-    dominance_ratio = df.groupby("speaker")["word_count"].sum() / total_words
-    interruption_counts = df.groupby("speaker")["interruption"].sum()
+    messages_per_speaker = agg["msgs"].sort_values(ascending=False, kind="stable")
+    by_speaker = agg.sort_index()
+    avg_length_per_speaker = by_speaker["avg_len"]
+    dominance_ratio = by_speaker["words"] / total_words
+    interruption_counts = by_speaker["interrupts"]
+    sentiment_by_speaker = (
+        pd.crosstab(df["speaker"], df["sentiment"])
+        .reindex(index=messages_per_speaker.index, columns=SENTIMENT_LABELS, fill_value=0)
+        .astype("int32")
+    )
 
-    sentiment_counts = df["sentiment"].value_counts()
-    sentiment_by_speaker = df.groupby("speaker")["sentiment"].value_counts().unstack(fill_value=0)
+    positive_count, neutral_count, negative_count = (
+        int(sentiment_counts.get(label, 0)) for label in SENTIMENT_LABELS
+    )
 
     flags: list[str] = []
-    negative_count = int(sentiment_counts.get("negative", 0))
     if negative_count >= 4:
         flags.append("Friction detected")
     dominant_speaker = dominance_ratio.idxmax()
     dominant_share = float(dominance_ratio.max())
     if dominant_share > 0.45:
         flags.append("Dominance imbalance")
-    total_interruptions = int(df["interruption"].sum())
+    total_interruptions = int(np.count_nonzero(df["interruption"]))
     if total_interruptions >= 2:
         flags.append("High overlap / interruptions")
 
@@ -114,7 +188,6 @@ def build_report(df: pd.DataFrame) -> str:
     else:
         dominance_note = "Participation is fairly balanced."
 
-    positive_count = int(sentiment_counts.get("positive", 0))
     if negative_count >= 4:
         sentiment_note = "Tone shows elevated friction."
     elif positive_count > negative_count:
@@ -124,70 +197,78 @@ def build_report(df: pd.DataFrame) -> str:
     else:
         sentiment_note = "Tone is mostly neutral."
 
-    lines: list[str] = ["# Conversation Intel Report", "", "## Summary"]
-    lines.append(f"- Total messages: {total_messages}")
-    lines.append(f"- Total words: {total_words}")
-    lines.append(f"- Average message length (words): {avg_message_length:.2f}")
-    lines.append(f"- Key takeaway: {dominance_note} {sentiment_note}")
-    lines.append(f"- Flags: {', '.join(flags) if flags else 'None'}")
-
-    lines.extend(["", "## Messages Per Speaker"])
-    for speaker, count in messages_per_speaker.items():
-        lines.append(f"- {speaker}: {count}")
-
-    lines.extend(["", "## Average Message Length (Words)"])
-    for speaker, avg_len in avg_length_per_speaker.items():
-        lines.append(f"- {speaker}: {avg_len:.2f}")
-
-    lines.extend(["", "## Dominance Ratio (Word Share)"])
-    for speaker, ratio in dominance_ratio.items():
-        lines.append(f"- {speaker}: {ratio * 100:.1f}%")
-
-    lines.extend(["", "## Interruptions"])
-    lines.append(f"- Total interruptions: {total_interruptions}")
-    for speaker, count in interruption_counts.items():
-        if count:
-            lines.append(f"- {speaker}: {int(count)}")
-
-    lines.extend(["", "## Sentiment (Rule-based)"])
-    for label in ("positive", "neutral", "negative"):
-        lines.append(f"- {label.capitalize()}: {int(sentiment_counts.get(label, 0))}")
-
-    lines.extend(["", "## Sentiment By Speaker"])
-    for speaker in messages_per_speaker.index:
-        pos = int(sentiment_by_speaker.get("positive", pd.Series()).get(speaker, 0))
-        neu = int(sentiment_by_speaker.get("neutral", pd.Series()).get(speaker, 0))
-        neg = int(sentiment_by_speaker.get("negative", pd.Series()).get(speaker, 0))
-        lines.append(f"- {speaker}: {pos} positive, {neu} neutral, {neg} negative")
-
-    lines.append("")
-    return "\n".join(lines)
+    flags_text = ", ".join(flags) if flags else "None"
+    messages_block = "\n".join(f"- {s}: {c}" for s, c in messages_per_speaker.items())
+    avg_length_block = "\n".join(f"- {s}: {v:.2f}" for s, v in avg_length_per_speaker.items())
+    dominance_block = "\n".join(f"- {s}: {r * 100:.1f}%" for s, r in dominance_ratio.items())
+    interruption_block = "\n".join(
+        [
+            f"- Total interruptions: {total_interruptions}",
+            *(f"- {s}: {int(c)}" for s, c in interruption_counts.items() if c),
+        ]
+    )
+    sentiment_block = (
+        f"- Positive: {positive_count}\n"
+        f"- Neutral: {neutral_count}\n"
+        f"- Negative: {negative_count}"
+    )
+    by_speaker_block = "\n".join(
+        f"- {speaker}: {pos} positive, {neu} neutral, {neg} negative"
+        for speaker, pos, neu, neg in sentiment_by_speaker.itertuples(index=True, name=None)
+    )
 
+    return (
+        "# Conversation Intel Report\n"
+        "\n"
+        "## Summary\n"
+        f"- Total messages: {total_messages}\n"
+        f"- Total words: {total_words}\n"
+        f"- Average message length (words): {avg_message_length:.2f}\n"
+        f"- Key takeaway: {dominance_note} {sentiment_note}\n"
+        f"- Flags: {flags_text}\n"
+        "\n"
+        "## Messages Per Speaker\n"
+        f"{messages_block}\n"
+        "\n"
+        "## Average Message Length (Words)\n"
+        f"{avg_length_block}\n"
+        "\n"
+        "## Dominance Ratio (Word Share)\n"
+        f"{dominance_block}\n"
+        "\n"
+        "## Interruptions\n"
+        f"{interruption_block}\n"
+        "\n"
+        "## Sentiment (Rule-based)\n"
+        f"{sentiment_block}\n"
+        "\n"
+        "## Sentiment By Speaker\n"
+        f"{by_speaker_block}\n"
+    )
 
-def print_summary(df: pd.DataFrame) -> None:
-    df = df.copy()
-    df["word_count"] = df["text"].apply(count_words)
-    df["sentiment"] = df["text"].apply(sentiment_label)
-    df["interruption"] = df["text"].str.contains("interrupt", case=False, regex=False)
 
+def print_summary(df: pd.DataFrame, agg: pd.DataFrame, sentiment_counts: pd.Series) -> None:
     total_messages = len(df)
     total_words = int(df["word_count"].sum())
     avg_message_length = df["word_count"].mean()
 
-    messages_per_speaker = df["speaker"].value_counts()
-    dominance_ratio = df.groupby("speaker")["word_count"].sum() / total_words
-    interruption_counts = df.groupby("speaker")["interruption"].sum()
-    sentiment_counts = df["sentiment"].value_counts()
+    messages_per_speaker = agg["msgs"].sort_values(ascending=False, kind="stable")
+    by_speaker = agg.sort_index()
+    dominance_ratio = by_speaker["words"] / total_words
+    interruption_counts = by_speaker["interrupts"]
+
+    positive_count, neutral_count, negative_count = (
+        int(sentiment_counts.get(label, 0)) for label in SENTIMENT_LABELS
+    )
 
     flags: list[str] = []
-    negative_count = int(sentiment_counts.get("negative", 0))
     if negative_count >= 4:
         flags.append("Friction detected")
     dominant_speaker = dominance_ratio.idxmax()
     dominant_share = float(dominance_ratio.max())
     if dominant_share > 0.45:
         flags.append("Dominance imbalance")
-    total_interruptions = int(df["interruption"].sum())
+    total_interruptions = int(np.count_nonzero(df["interruption"]))
     if total_interruptions >= 2:
         flags.append("High overlap / interruptions")
 
@@ -196,7 +277,6 @@ def print_summary(df: pd.DataFrame) -> None:
     else:
         dominance_note = "Participation is fairly balanced."
 
-    positive_count = int(sentiment_counts.get("positive", 0))
     if negative_count >= 4:
         sentiment_note = "Tone shows elevated friction."
     elif positive_count > negative_count:
@@ -225,8 +305,9 @@ def print_summary(df: pd.DataFrame) -> None:
         if count:
             print(f"- {speaker}: {int(count)}")
     print("Sentiment (rule-based):")
-    for label in ("positive", "neutral", "negative"):
-        print(f"- {label.capitalize()}: {int(sentiment_counts.get(label, 0))}")
+    print(f"- Positive: {positive_count}")
+    print(f"- Neutral: {neutral_count}")
+    print(f"- Negative: {negative_count}")
 
 
 def main() -> int:
@@ -237,9 +318,10 @@ def main() -> int:
         print(f"Error: {exc}")
         return 1
 
-    report = build_report(df)
-    Path("report.md").write_text(report, encoding="utf-8")
-    print_summary(df)
+    derived, agg, sentiment_counts = _prepare(df)
+    report = build_report(derived, agg, sentiment_counts)
+    Path("report.md").write_bytes(report.encode("utf-8"))
+    print_summary(derived, agg, sentiment_counts)
     print("Report written to report.md")
     return 0
 